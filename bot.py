@@ -12,10 +12,14 @@ import json
 import hashlib
 import secrets
 import base58
-from datetime import datetime, timedelta
+import time
+import itertools
+from collections import OrderedDict, deque
+from datetime import datetime, timedelta, timezone
 from typing import Optional, List, Dict
 import aiohttp
 import os
+import signal
 from aiohttp import web
 
 # ============================================================================
@@ -29,6 +33,14 @@ class Config:
     API_BASE = "https://ordinals.gorillapool.io/api"
     REVERIFY_HOURS = 168
     MAX_VERIFICATIONS_PER_HOUR = 5
+    STATS_TOKEN = os.getenv("STATS_TOKEN")
+    ANALYTICS_FLUSH_SECONDS = 60
+    ANALYTICS_RETENTION_DAYS = 30
+    INSCRIPTION_CACHE_SIZE = 10000
+    VERIFY_WORKERS = int(os.getenv("VERIFY_WORKERS", "4"))
+    MAX_QUEUE_DEPTH = int(os.getenv("MAX_QUEUE_DEPTH", "500"))
+    INTERACTION_TOKEN_MINUTES = 15
+    JOB_DEADLINE_MARGIN_SECONDS = 60
     
     COLLECTIONS = {
         "ORDINAL 🌈 RAINBOWS Vol. 1": {
@@ -81,8 +93,300 @@ async def init_database():
             )
         """)
         
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS holder_tiers (
+                discord_id TEXT PRIMARY KEY,
+                tier TEXT
+            )
+        """)
+        
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS stats_counters (
+                name TEXT PRIMARY KEY,
+                value INTEGER DEFAULT 0
+            )
+        """)
+        
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS stats_hourly (
+                bucket TEXT PRIMARY KEY,
+                verifications INTEGER DEFAULT 0,
+                failures INTEGER DEFAULT 0,
+                upstream_calls INTEGER DEFAULT 0,
+                upstream_errors INTEGER DEFAULT 0,
+                upstream_ms INTEGER DEFAULT 0,
+                upstream_max_ms INTEGER DEFAULT 0,
+                cache_hits INTEGER DEFAULT 0,
+                cache_misses INTEGER DEFAULT 0
+            )
+        """)
+        
         await db.commit()
 
+# ============================================================================
+# ANALYTICS
+# ============================================================================
+
+class Analytics:
+    """Counters updated on every event so /stats never has to scan tables.
+
+    Lifetime totals live in `stats_counters`. Verification counters are
+    incremented in the same transaction as the verification; failure
+    counters are written by a background task. Per-hour activity lives in
+    `stats_hourly` and is flushed by the background rollup task. Both are
+    mirrored in memory, so reading them is O(1) regardless of table size.
+    """
+    
+    BUCKET_FIELDS = (
+        "verifications", "failures", "upstream_calls", "upstream_errors",
+        "upstream_ms", "upstream_max_ms", "cache_hits", "cache_misses"
+    )
+    HISTORY_HOURS = 168
+    
+    def __init__(self):
+        self.counters: Dict[str, int] = {}
+        self.current = self._new_bucket(self._bucket_start(datetime.now()))
+        self.history = deque(maxlen=self.HISTORY_HOURS)
+        self.pending = []
+        self._writes = set()
+    
+    @staticmethod
+    def _bucket_start(now: datetime) -> datetime:
+        return now.replace(minute=0, second=0, microsecond=0)
+    
+    def _new_bucket(self, start: datetime) -> Dict:
+        bucket = {field: 0 for field in self.BUCKET_FIELDS}
+        bucket["start"] = start
+        return bucket
+    
+    def roll(self, now: Optional[datetime] = None):
+        """Close the current hourly bucket once its hour has passed"""
+        start = self._bucket_start(now or datetime.now())
+        if start != self.current["start"]:
+            self.history.append(self.current)
+            self.pending.append(self.current)
+            self.current = self._new_bucket(start)
+    
+    @staticmethod
+    async def increment(db, deltas: Dict[str, int]):
+        """Add `deltas` to stats_counters inside the caller's transaction"""
+        await db.executemany(
+            "INSERT OR IGNORE INTO stats_counters (name, value) VALUES (?, 0)",
+            [(name,) for name in deltas]
+        )
+        await db.executemany(
+            "UPDATE stats_counters SET value = value + ? WHERE name = ?",
+            [(amount, name) for name, amount in deltas.items()]
+        )
+    
+    def _apply(self, deltas: Dict[str, int]):
+        """Mirror committed counter deltas in memory"""
+        for name, amount in deltas.items():
+            self.counters[name] = self.counters.get(name, 0) + amount
+    
+    # ------------------------------------------------------------------ events
+    
+    @staticmethod
+    def verification_deltas(tier: Optional[str], previous_tier: Optional[str], new_holder: bool) -> Dict[str, int]:
+        deltas = {"verifications": 1}
+        if new_holder:
+            deltas["holders"] = 1
+        if tier != previous_tier:
+            if previous_tier:
+                deltas[f"tier:{previous_tier}"] = -1
+            if tier:
+                deltas[f"tier:{tier}"] = 1
+        return deltas
+    
+    def record_verification(self, deltas: Dict[str, int]):
+        """Call once the transaction that ran `increment(db, deltas)` has committed"""
+        self.roll()
+        self.current["verifications"] += 1
+        self._apply(deltas)
+    
+    def record_failure(self, reason: str):
+        """Count a failure now and persist it in the background.
+
+        Callers are often inside Discord's 3-second response window, so
+        this must never wait on SQLite.
+        """
+        deltas = {"failures": 1, f"failure:{reason}": 1}
+        self.roll()
+        self.current["failures"] += 1
+        self._apply(deltas)
+        
+        task = asyncio.create_task(self._persist(deltas))
+        self._writes.add(task)
+        task.add_done_callback(self._writes.discard)
+    
+    async def _persist(self, deltas: Dict[str, int]):
+        try:
+            async with aiosqlite.connect("bot_data.db") as db:
+                await self.increment(db, deltas)
+                await db.commit()
+        except Exception as e:
+            print(f"Analytics write error: {e}")
+    
+    def record_upstream(self, elapsed_ms: int, ok: bool):
+        self.roll()
+        self.current["upstream_calls"] += 1
+        self.current["upstream_ms"] += elapsed_ms
+        self.current["upstream_max_ms"] = max(self.current["upstream_max_ms"], elapsed_ms)
+        if not ok:
+            self.current["upstream_errors"] += 1
+    
+    def record_cache(self, hit: bool):
+        self.roll()
+        self.current["cache_hits" if hit else "cache_misses"] += 1
+    
+    # ------------------------------------------------------------- persistence
+    
+    async def load(self):
+        now = datetime.now()
+        async with aiosqlite.connect("bot_data.db") as db:
+            cursor = await db.execute("SELECT name, value FROM stats_counters")
+            self.counters = {name: value for name, value in await cursor.fetchall()}
+            
+            if "holders" not in self.counters:
+                # One-off seed for databases created before analytics existed
+                cursor = await db.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(verification_count), 0) FROM verifications"
+                )
+                holders, verifications = await cursor.fetchone()
+                seed = {"holders": holders, "verifications": verifications}
+                await db.executemany(
+                    "INSERT OR IGNORE INTO stats_counters (name, value) VALUES (?, ?)",
+                    list(seed.items())
+                )
+                await db.commit()
+                self.counters.update(seed)
+            
+            cursor = await db.execute(
+                f"SELECT bucket, {', '.join(self.BUCKET_FIELDS)} FROM stats_hourly "
+                "WHERE bucket >= ? ORDER BY bucket",
+                ((now - timedelta(hours=self.HISTORY_HOURS)).isoformat(),)
+            )
+            rows = await cursor.fetchall()
+        
+        self.history.clear()
+        self.current = self._new_bucket(self._bucket_start(now))
+        for row in rows:
+            bucket = dict(zip(self.BUCKET_FIELDS, row[1:]))
+            bucket["start"] = datetime.fromisoformat(row[0])
+            if bucket["start"] == self.current["start"]:
+                self.current = bucket
+            else:
+                self.history.append(bucket)
+    
+    async def flush(self):
+        if self._writes:
+            await asyncio.gather(*self._writes, return_exceptions=True)
+        self.roll()
+        closed = list(self.pending)
+        buckets = closed + [self.current]
+        cutoff = datetime.now() - timedelta(days=config.ANALYTICS_RETENTION_DAYS)
+        
+        async with aiosqlite.connect("bot_data.db") as db:
+            await db.executemany(
+                f"INSERT OR REPLACE INTO stats_hourly (bucket, {', '.join(self.BUCKET_FIELDS)}) "
+                f"VALUES (?{', ?' * len(self.BUCKET_FIELDS)})",
+                [
+                    (b["start"].isoformat(), *(b[field] for field in self.BUCKET_FIELDS))
+                    for b in buckets
+                ]
+            )
+            await db.execute("DELETE FROM stats_hourly WHERE bucket < ?", (cutoff.isoformat(),))
+            await db.commit()
+        
+        # Buckets closed while the write was in flight stay pending for next time
+        del self.pending[:len(closed)]
+    
+    # ---------------------------------------------------------------- reporting
+    
+    def window(self, hours: int) -> Dict[str, int]:
+        """Sum hourly buckets covering the last `hours` hours (current included)"""
+        self.roll()
+        since = self.current["start"] - timedelta(hours=hours - 1)
+        totals = {field: 0 for field in self.BUCKET_FIELDS}
+        for bucket in list(self.history) + [self.current]:
+            if bucket["start"] < since:
+                continue
+            for field in self.BUCKET_FIELDS:
+                if field == "upstream_max_ms":
+                    totals[field] = max(totals[field], bucket[field])
+                else:
+                    totals[field] += bucket[field]
+        return totals
+    
+    def hourly(self, hours: int) -> List[Dict]:
+        """Per-hour activity for the last `hours` hours, oldest first, gaps zero-filled"""
+        self.roll()
+        by_start = {b["start"]: b for b in list(self.history)[-hours:]}
+        by_start[self.current["start"]] = self.current
+        series = []
+        for offset in range(hours - 1, -1, -1):
+            start = self.current["start"] - timedelta(hours=offset)
+            bucket = by_start.get(start)
+            series.append({
+                "hour": start.isoformat(),
+                "verifications": bucket["verifications"] if bucket else 0,
+                "failures": bucket["failures"] if bucket else 0,
+            })
+        return series
+    
+    def snapshot(self) -> Dict:
+        tiers = {
+            name.split(":", 1)[1]: value
+            for name, value in self.counters.items()
+            if name.startswith("tier:") and value > 0
+        }
+        holders = self.counters.get("holders", 0)
+        unclassified = holders - sum(tiers.values())
+        if unclassified > 0:
+            tiers["unclassified"] = unclassified
+        
+        day = self.window(24)
+        lookups = day["cache_hits"] + day["cache_misses"]
+        
+        return {
+            "holders": holders,
+            "holders_per_tier": tiers,
+            "verifications": {
+                "total": self.counters.get("verifications", 0),
+                "this_hour": self.current["verifications"],
+                "last_24h": day["verifications"],
+                "last_7d": self.window(self.HISTORY_HOURS)["verifications"],
+            },
+            "verifications_per_hour": self.hourly(24),
+            "failure_reasons": {
+                name.split(":", 1)[1]: value
+                for name, value in self.counters.items()
+                if name.startswith("failure:")
+            },
+            "upstream_24h": {
+                "calls": day["upstream_calls"],
+                "errors": day["upstream_errors"],
+                "avg_ms": round(day["upstream_ms"] / day["upstream_calls"]) if day["upstream_calls"] else None,
+                "max_ms": day["upstream_max_ms"],
+            },
+            "cache_24h": {
+                "hits": day["cache_hits"],
+                "misses": day["cache_misses"],
+                "hit_rate": round(day["cache_hits"] / lookups, 4) if lookups else None,
+            },
+        }
+
+analytics = Analytics()
+
+async def analytics_rollup_loop():
+    """Roll and persist hourly buckets in the background"""
+    while True:
+        await asyncio.sleep(config.ANALYTICS_FLUSH_SECONDS)
+        try:
+            await analytics.flush()
+        except Exception as e:
+            print(f"Analytics flush error: {e}")
+
 # ============================================================================
 # BSV SIGNATURE VERIFICATION (Simplified)
 # ============================================================================
@@ -108,12 +412,19 @@ class BSVVerifier:
 # ============================================================================
 
 class OrdinalsAPI:
+    # Inscription metadata is immutable per origin, so lookups are cached (LRU)
+    _inscription_cache: "OrderedDict[str, Dict]" = OrderedDict()
+    
     @staticmethod
     async def get_address_ordinals(address: str, collection_id: str = None) -> List[Dict]:
+        started = None
         try:
             async with aiohttp.ClientSession() as session:
                 url = f"{config.API_BASE}/txos/address/{address}/unspent?limit=1000"
+                started = time.monotonic()
                 async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
+                    analytics.record_upstream(int((time.monotonic() - started) * 1000), resp.status == 200)
+                    started = None
                     if resp.status != 200:
                         return []
                     
@@ -133,19 +444,36 @@ class OrdinalsAPI:
                     
                     return ordinals
         except Exception as e:
+            if started is not None:
+                analytics.record_upstream(int((time.monotonic() - started) * 1000), False)
             print(f"API error: {e}")
             return []
     
     @staticmethod
     async def get_inscription_data(origin: str) -> Optional[Dict]:
+        cache = OrdinalsAPI._inscription_cache
+        if origin in cache:
+            cache.move_to_end(origin)
+            analytics.record_cache(hit=True)
+            return cache[origin]
+        analytics.record_cache(hit=False)
+        
+        started = time.monotonic()
         try:
             async with aiohttp.ClientSession() as session:
                 url = f"{config.API_BASE}/inscriptions/origin/{origin}"
                 async with session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as resp:
+                    analytics.record_upstream(int((time.monotonic() - started) * 1000), resp.status == 200)
+                    started = None
                     if resp.status == 200:
-                        return await resp.json()
-        except:
-            pass
+                        data = await resp.json()
+                        cache[origin] = data
+                        if len(cache) > config.INSCRIPTION_CACHE_SIZE:
+                            cache.popitem(last=False)
+                        return data
+        except Exception:
+            if started is not None:
+                analytics.record_upstream(int((time.monotonic() - started) * 1000), False)
         return None
 
 # ============================================================================
@@ -175,6 +503,119 @@ class RarityCalculator:
         
         return 'common'
 
+# ============================================================================
+# VERIFICATION QUEUE
+# ============================================================================
+
+class VerificationQueue:
+    """Bounded priority queue feeding a fixed pool of verification workers.
+
+    Caps how many upstream fan-outs run at once, lets first-time holders
+    jump ahead of re-checks, and drops jobs whose interaction token has
+    expired before a worker gets to them. Only the upstream lookup is
+    cancelled on deadline; once roles are being assigned the job finishes.
+    """
+    
+    PRIORITY_NEW = 0
+    PRIORITY_RECHECK = 1
+    
+    def __init__(self, workers: int, max_depth: int):
+        if workers < 1:
+            raise ValueError(f"VERIFY_WORKERS must be at least 1, got {workers}")
+        if max_depth < 1:
+            raise ValueError(f"MAX_QUEUE_DEPTH must be at least 1, got {max_depth}")
+        self.workers = workers
+        self.max_depth = max_depth
+        self.busy = 0
+        self._queue = asyncio.PriorityQueue()
+        self._seq = itertools.count()
+        self._queued: Dict[int, tuple] = {}
+        self._in_flight: Dict[int, int] = {}
+    
+    def depth(self) -> int:
+        return len(self._queued)
+    
+    def idle_workers(self) -> int:
+        return self.workers - self.busy
+    
+    def in_flight(self, user_id: int) -> bool:
+        """Whether a worker is currently processing this user's job"""
+        return self._in_flight.get(user_id, 0) > 0
+    
+    def position(self, user_id: int) -> Optional[int]:
+        """1-based place in line for a queued user, or None"""
+        entry = self._queued.get(user_id)
+        if entry is None:
+            return None
+        return sum(1 for other in self._queued.values() if other[:2] <= entry[:2])
+    
+    @staticmethod
+    def deadline(interaction: discord.Interaction) -> datetime:
+        """Last moment a job can still answer through the interaction token"""
+        return interaction.created_at + timedelta(
+            minutes=config.INTERACTION_TOKEN_MINUTES,
+            seconds=-config.JOB_DEADLINE_MARGIN_SECONDS
+        )
+    
+    def submit(self, interaction: discord.Interaction, address: str, priority: int) -> int:
+        """Queue a verification and return its place in line.
+
+        Raises ValueError if the user already has a job queued or running,
+        and asyncio.QueueFull when the queue is at MAX_QUEUE_DEPTH. Never
+        awaits, so the duplicate check and the enqueue are atomic.
+        """
+        user_id = interaction.user.id
+        if user_id in self._queued or self.in_flight(user_id):
+            raise ValueError(f"verification already pending for {user_id}")
+        if self.depth() >= self.max_depth:
+            raise asyncio.QueueFull
+        
+        entry = (priority, next(self._seq), interaction, address)
+        self._queued[interaction.user.id] = entry
+        self._queue.put_nowait(entry)
+        return self.position(interaction.user.id)
+    
+    async def _worker(self):
+        while True:
+            _, _, interaction, address = await self._queue.get()
+            user_id = interaction.user.id
+            self._queued.pop(user_id, None)
+            self._in_flight[user_id] = self._in_flight.get(user_id, 0) + 1
+            self.busy += 1
+            try:
+                await process_submission(interaction, address, self.deadline(interaction))
+            except asyncio.TimeoutError:
+                analytics.record_failure("deadline_expired")
+                try:
+                    await interaction.followup.send(
+                        "⏰ Verification took too long. Please run `/submit` again.",
+                        ephemeral=True
+                    )
+                except Exception:
+                    pass
+            except Exception as e:
+                analytics.record_failure("error")
+                print(f"Verification job error: {e}")
+                try:
+                    await interaction.followup.send(
+                        "❌ Verification failed. Please try again later.",
+                        ephemeral=True
+                    )
+                except Exception:
+                    pass
+            finally:
+                self._in_flight[user_id] -= 1
+                if not self._in_flight[user_id]:
+                    del self._in_flight[user_id]
+                self.busy -= 1
+                self._queue.task_done()
+    
+    async def run(self):
+        """Run the worker pool forever"""
+        await asyncio.gather(*(self._worker() for _ in range(self.workers)))
+
+verification_queue = VerificationQueue(config.VERIFY_WORKERS, config.MAX_QUEUE_DEPTH)
+
 # ============================================================================
 # DISCORD BOT
 # ============================================================================
@@ -216,6 +657,7 @@ async def verify(interaction: discord.Interaction):
         count = (await cursor.fetchone())[0]
         
         if count >= config.MAX_VERIFICATIONS_PER_HOUR:
+            analytics.record_failure("rate_limited")
             await interaction.response.send_message(
                 "⏱️ Rate limit exceeded. Please try again later.",
                 ephemeral=True
@@ -278,6 +720,7 @@ async def submit(interaction: discord.Interaction, address: str, signature: str)
     await interaction.response.defer(ephemeral=True)
     
     if interaction.user.id not in verification_sessions:
+        analytics.record_failure("no_session")
         await interaction.followup.send(
             "❌ No verification session found. Please run `/verify` first.",
             ephemeral=True
@@ -288,6 +731,7 @@ async def submit(interaction: discord.Interaction, address: str, signature: str)
     
     if datetime.now() - session['timestamp'] > timedelta(minutes=10):
         del verification_sessions[interaction.user.id]
+        analytics.record_failure("session_expired")
         await interaction.followup.send(
             "⏰ Verification session expired. Please run `/verify` again.",
             ephemeral=True
@@ -295,18 +739,65 @@ async def submit(interaction: discord.Interaction, address: str, signature: str)
         return
     
     if not BSVVerifier.verify_signature(session['message'], address, signature):
+        analytics.record_failure("invalid_signature")
         await interaction.followup.send(
             "❌ Invalid signature. Please ensure you signed the correct message.",
             ephemeral=True
         )
         return
     
-    ordinals = await OrdinalsAPI.get_address_ordinals(
-        address,
-        config.COLLECTIONS["ORDINAL 🌈 RAINBOWS Vol. 1"]["collection_id"]
+    async with aiosqlite.connect("bot_data.db") as db:
+        cursor = await db.execute(
+            "SELECT 1 FROM verifications WHERE discord_id = ?",
+            (str(interaction.user.id),)
+        )
+        returning = await cursor.fetchone() is not None
+    
+    # No awaits between here and submit(), so a double click cannot queue twice
+    try:
+        position = verification_queue.submit(
+            interaction,
+            address,
+            VerificationQueue.PRIORITY_RECHECK if returning else VerificationQueue.PRIORITY_NEW
+        )
+    except ValueError:
+        queued_at = verification_queue.position(interaction.user.id)
+        await interaction.followup.send(
+            f"⏳ Your verification is already queued (#{queued_at} in line)." if queued_at
+            else "⏳ Your verification is already being processed. Results will appear shortly.",
+            ephemeral=True
+        )
+        return
+    except asyncio.QueueFull:
+        analytics.record_failure("queue_full")
+        await interaction.followup.send(
+            "🚦 Verification queue is full right now. Please try again in a few minutes.",
+            ephemeral=True
+        )
+        return
+    
+    if position > verification_queue.idle_workers():
+        await interaction.followup.send(
+            f"⏳ You're #{position} in line. Your result will appear here shortly.",
+            ephemeral=True
+        )
+
+async def process_submission(interaction: discord.Interaction, address: str, deadline: datetime):
+    """Look up ordinals and assign roles for a queued /submit"""
+    remaining = (deadline - datetime.now(timezone.utc)).total_seconds()
+    if remaining <= 0:
+        raise asyncio.TimeoutError
+    
+    ordinals = await asyncio.wait_for(
+        OrdinalsAPI.get_address_ordinals(
+            address,
+            config.COLLECTIONS["ORDINAL 🌈 RAINBOWS Vol. 1"]["collection_id"]
+        ),
+        timeout=remaining
     )
     
     if not ordinals:
+        analytics.record_failure("no_ordinals")
         await interaction.followup.send(
             "❌ No RAINBOW ordinals found at this address.",
             ephemeral=True
@@ -318,6 +809,10 @@ async def submit(interaction: discord.Interaction, address: str, signature: str)
         config.COLLECTIONS["ORDINAL 🌈 RAINBOWS Vol. 1"]
     )
     
+    # Last deadline check: roles and their database record must not be split by a cancel
+    if datetime.now(timezone.utc) >= deadline:
+        raise asyncio.TimeoutError
+    
     guild = bot.get_guild(config.GUILD_ID)
     member = guild.get_member(interaction.user.id)
     
@@ -337,6 +832,19 @@ async def submit(interaction: discord.Interaction, address: str, signature: str)
     await member.add_roles(*roles_to_assign)
     
     async with aiosqlite.connect("bot_data.db") as db:
+        cursor = await db.execute(
+            "SELECT 1 FROM verifications WHERE discord_id = ?",
+            (str(interaction.user.id),)
+        )
+        new_holder = await cursor.fetchone() is None
+        
+        cursor = await db.execute(
+            "SELECT tier FROM holder_tiers WHERE discord_id = ?",
+            (str(interaction.user.id),)
+        )
+        row = await cursor.fetchone()
+        previous_tier = row[0] if row else None
+        
         await db.execute(
             """INSERT OR REPLACE INTO verifications 
                (discord_id, last_verified, assigned_roles, verification_count)
@@ -344,14 +852,24 @@ async def submit(interaction: discord.Interaction, address: str, signature: str)
             (str(interaction.user.id), datetime.now(), json.dumps([r.id for r in roles_to_assign]), str(interaction.user.id))
         )
         
+        await db.execute(
+            "INSERT OR REPLACE INTO holder_tiers (discord_id, tier) VALUES (?, ?)",
+            (str(interaction.user.id), rarity)
+        )
+        
         await db.execute(
             "INSERT INTO rate_limits (discord_id, timestamp) VALUES (?, ?)",
             (str(interaction.user.id), datetime.now())
         )
         
+        deltas = analytics.verification_deltas(rarity, previous_tier, new_holder)
+        await analytics.increment(db, deltas)
+        
         await db.commit()
     
-    del verification_sessions[interaction.user.id]
+    analytics.record_verification(deltas)
+    
+    verification_sessions.pop(interaction.user.id, None)
     
     embed = discord.Embed(
         title="✅ Verification Successful!",
@@ -369,7 +887,11 @@ async def submit(interaction: discord.Interaction, address: str, signature: str)
             inline=False
         )
     
-    await interaction.followup.send(embed=embed, ephemeral=True)
+    # The verification is already committed; a lost reply must not count as a failure
+    try:
+        await interaction.followup.send(embed=embed, ephemeral=True)
+    except Exception as e:
+        print(f"Could not deliver verification result: {e}")
 
 # ============================================================================
 # ADMIN COMMANDS
@@ -402,24 +924,57 @@ async def setrole(interaction: discord.Interaction, tier: str, role: discord.Rol
 @bot.tree.command(name="stats", description="[ADMIN] View verification statistics")
 @is_admin()
 async def stats(interaction: discord.Interaction):
-    async with aiosqlite.connect("bot_data.db") as db:
-        cursor = await db.execute("SELECT COUNT(*) FROM verifications")
-        total_verified = (await cursor.fetchone())[0]
-        
-        cursor = await db.execute(
-            "SELECT COUNT(*) FROM verifications WHERE last_verified > ?",
-            (datetime.now() - timedelta(days=7),)
-        )
-        week_verified = (await cursor.fetchone())[0]
+    data = analytics.snapshot()
     
     embed = discord.Embed(
         title="📊 Bot Statistics",
         color=discord.Color.blue()
     )
     
-    embed.add_field(name="Total Verified Users", value=str(total_verified), inline=True)
-    embed.add_field(name="Verified This Week", value=str(week_verified), inline=True)
+    embed.add_field(name="Total Verified Users", value=str(data["holders"]), inline=True)
+    embed.add_field(name="Verifications (7d)", value=str(data["verifications"]["last_7d"]), inline=True)
     embed.add_field(name="Active Sessions", value=str(len(verification_sessions)), inline=True)
+    embed.add_field(
+        name="🚦 Queue",
+        value=f"Waiting: {verification_queue.depth()}/{verification_queue.max_depth}\n"
+              f"Busy workers: {verification_queue.busy}/{verification_queue.workers}",
+        inline=True
+    )
+    
+    tiers = data["holders_per_tier"]
+    embed.add_field(
+        name="🏆 Holders per Tier",
+        value="\n".join([f"• {tier.capitalize()}: {count}" for tier, count in sorted(tiers.items())]) or "None yet",
+        inline=False
+    )
+    
+    embed.add_field(
+        name="📈 Verifications",
+        value=f"This hour: {data['verifications']['this_hour']}\n"
+              f"Last 24h: {data['verifications']['last_24h']}\n"
+              f"All time: {data['verifications']['total']}",
+        inline=True
+    )
+    
+    reasons = data["failure_reasons"]
+    embed.add_field(
+        name="❌ Failures",
+        value="\n".join([f"• {reason}: {count}" for reason, count in sorted(reasons.items(), key=lambda x: -x[1])]) or "None",
+        inline=True
+    )
+    
+    upstream = data["upstream_24h"]
+    avg_ms = f"{upstream['avg_ms']} ms" if upstream["avg_ms"] is not None else "-"
+    hit_rate = data["cache_24h"]["hit_rate"]
+    hit_rate = f"{hit_rate:.0%}" if hit_rate is not None else "-"
+    embed.add_field(
+        name="🌐 GorillaPool (24h)",
+        value=f"Calls: {upstream['calls']} ({upstream['errors']} errors)\n"
+              f"Avg latency: {avg_ms}\n"
+              f"Max latency: {upstream['max_ms']} ms\n"
+              f"Cache hit rate: {hit_rate}",
+        inline=False
+    )
     
     await interaction.response.send_message(embed=embed, ephemeral=True)
 
@@ -431,11 +986,31 @@ async def health_check(request):
     """Health check endpoint for Cloud Run"""
     return web.Response(text="Bot is running", status=200)
 
+async def stats_json(request):
+    """Admin analytics as JSON (Authorization: Bearer <STATS_TOKEN>)"""
+    if not config.STATS_TOKEN:
+        return web.json_response({"error": "not found"}, status=404)
+    
+    supplied = request.headers.get('Authorization', '').removeprefix('Bearer ')
+    if not secrets.compare_digest(supplied.encode(), config.STATS_TOKEN.encode()):
+        return web.json_response({"error": "unauthorized"}, status=401)
+    
+    data = analytics.snapshot()
+    data["active_sessions"] = len(verification_sessions)
+    data["queue"] = {
+        "depth": verification_queue.depth(),
+        "max_depth": verification_queue.max_depth,
+        "busy_workers": verification_queue.busy,
+        "workers": verification_queue.workers,
+    }
+    return web.json_response(data)
+
 async def run_web_server():
     """Run HTTP server on port 8080 for Cloud Run"""
     app = web.Application()
     app.router.add_get('/', health_check)
     app.router.add_get('/health', health_check)
+    app.router.add_get('/stats.json', stats_json)
     
     runner = web.AppRunner(app)
     await runner.setup()
@@ -451,20 +1026,33 @@ async def run_web_server():
         await asyncio.sleep(3600)
 
 # ============================================================================
-# MAIN - RUN BOTH BOT AND WEB SERVER
+# MAIN - RUN BOT, WEB SERVER AND BACKGROUND TASKS
 # ============================================================================
 
 async def main():
-    """Run both Discord bot and web server concurrently"""
-    await asyncio.gather(
-        bot.start(config.BOT_TOKEN),
-        run_web_server()
-    )
+    """Run Discord bot, web server, verification workers and analytics rollup concurrently"""
+    await init_database()
+    await analytics.load()
+    
+    # Cloud Run sends SIGTERM on shutdown; cancel so the final flush below runs
+    try:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+    except NotImplementedError:
+        pass  # Windows event loops have no signal handlers
+    
+    try:
+        await asyncio.gather(
+            bot.start(config.BOT_TOKEN),
+            run_web_server(),
+            verification_queue.run(),
+            analytics_rollup_loop()
+        )
+    finally:
+        await analytics.flush()
 
 if __name__ == "__main__":
     print("🚀 Starting BSV Ordinals Discord Bot...")
     asyncio.run(main())
 
-      CMD ["python", "bot.py"]
 
- 
\ No newline at end of file
+ 